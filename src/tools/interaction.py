@@ -3,13 +3,17 @@
 Ported from src/mcp-tools/tools/interaction.ts
 """
 
-from typing import Literal, Optional
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Literal, Optional
 
-from playwright.async_api import Page
 from pydantic import BaseModel, Field, model_validator
 
 from src.tools.base import ToolResult, async_session_tool
 
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+
 # ============= Tool Argument Schemas =============
 
 
@@ -181,22 +185,23 @@ def _get_locator(page: Page, selector: str):
     """
     selector = selector.strip()
 
-    # Parse nth index and hasText filters before other processing
+    # Parse nth index and hasText filters before other processing.
+    # Plain str.partition/rpartition (single C-level scans) instead of the
+    # regex engine - these are fixed-literal splits on a hot path.
     nth_index = None
     has_text_pattern = None
 
     # Extract [nth=N] suffix
-    import re
-    nth_match = re.search(r'\[nth=(\d+)\]$', selector)
-    if nth_match:
-        nth_index = int(nth_match.group(1))
-        selector = selector[:nth_match.start()].strip()
-
-    # Extract :hasText(...) prefix/suffix
-    has_text_match = re.search(r':hasText\(([^)]+)\)', selector)
-    if has_text_match:
-        has_text_pattern = has_text_match.group(1)
-        selector = selector[:has_text_match.start()].strip()
+    base, sep, tail = selector.rpartition("[nth=")
+    if sep and tail.endswith("]") and tail[:-1].isdigit():
+        nth_index = int(tail[:-1])
+        selector = base.strip()
+
+    # Extract :hasText(...) suffix
+    pre, sep, rest = selector.partition(":hasText(")
+    if sep:
+        has_text_pattern, _, _ = rest.partition(")")
+        selector = pre.strip()
 
     # Build base locator using existing logic
     locator = _get_base_locator(page, selector)
@@ -4,14 +4,19 @@ Tracks elements from accessibility snapshots and resolves refs to locators.
 Based on Microsoft Playwright MCP patterns.
 """
 
+from __future__ import annotations
+
 import json
 import os
 import time
 import weakref
+from array import array
+from collections import deque
 from dataclasses import dataclass
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any
 
-from playwright.async_api import Page, Locator
+if TYPE_CHECKING:
+    from playwright.async_api import Locator, Page
 
 
 # ============= Configuration =============
@@ -24,11 +29,16 @@ _ref_registries: "weakref.WeakKeyDictionary[Page, dict[str, Any]]" = weakref.Wea
 # Performance timing tracking
 _ref_timing: dict[str, list[float]] = {}
 
+# Preallocated ref-id strings ("e0", "e1", ...) so the hot numbering loop
+# in generate_refs indexes a list instead of formatting a fresh string per
+# node. Facebook-scale snapshots stay well under this bound.
+_REF_IDS: list[str] = [f"e{i}" for i in range(8192)]
+
 
 # ============= Data Structures =============
 
 
-@dataclass
+@dataclass(slots=True)
 class ElementRef:
     """Reference to an element in the accessibility tree."""
     ref: str                    # e.g., "e42" or "0.3.1"
@@ -39,7 +49,54 @@ class ElementRef:
     attributes: dict[str, str]  # aria-label, id, data-testid, etc.
 
 
-@dataclass
+@dataclass(slots=True)
+class FlatTree:
+    """Accessibility tree flattened into parallel arrays (SoA layout).
+
+    Replaces pointer-chasing through nested node dicts with contiguous
+    arrays: node i has role ``roles[i]``, name ``names[i]``, its first
+    child at ``first_child[i]`` and the next node under the same parent
+    at ``next_sibling[i]`` (-1 means none).
+    """
+    roles: list[str]
+    names: list[str]
+    first_child: array  # array('i'): index of first child, -1 if leaf
+    next_sibling: array  # array('i'): index of next sibling, -1 if last
+
+
+def _flatten_tree(root: dict) -> FlatTree:
+    """Flatten a nested accessibility-tree dict into a FlatTree in one BFS pass."""
+    roles: list[str] = []
+    names: list[str] = []
+    first_child = array("i")
+    next_sibling = array("i")
+
+    # Index of the most recently added child per parent, for sibling linking
+    last_child: dict[int, int] = {}
+
+    queue: deque[tuple[dict, int]] = deque([(root, -1)])
+    while queue:
+        node, parent = queue.popleft()
+        index = len(roles)
+        roles.append(node.get("role", ""))
+        names.append(node.get("name", ""))
+        first_child.append(-1)
+        next_sibling.append(-1)
+
+        if parent >= 0:
+            if first_child[parent] == -1:
+                first_child[parent] = index
+            else:
+                next_sibling[last_child[parent]] = index
+            last_child[parent] = index
+
+        for child in node.get("children", []):
+            queue.append((child, index))
+
+    return FlatTree(roles=roles, names=names, first_child=first_child, next_sibling=next_sibling)
+
+
+@dataclass(slots=True)
 class SnapshotData:
     """Structured snapshot data with element mapping."""
     refs: dict[str, ElementRef]  # ref -> ElementRef
@@ -124,44 +181,89 @@ def time_ref_op(operation: str, duration: float) -> None:
 # ============= Ref Generation =============
 
 
-def _build_snapshot_yaml(node: dict, refs: dict[str, ElementRef], indent: int = 0, ref_lookup: dict | None = None) -> str:
-    """Build human-readable YAML snapshot from accessibility tree.
+# Shared empty inner level for ref_lookup misses (avoids allocating {} per probe)
+_EMPTY_LOOKUP: dict[str, list[str]] = {}
+
+# Precomputed indent prefixes so the YAML assembly loop indexes a tuple
+# instead of allocating a fresh "  " * depth string per line
+_INDENTS: tuple[bytes, ...] = tuple(b"  " * i for i in range(64))
+
+
+def _build_snapshot_yaml_bytes(node: dict, refs: dict[str, ElementRef], indent: int = 0, ref_lookup: dict[str, dict[str, list[str]]] | None = None) -> bytes:
+    """Build the snapshot YAML directly as UTF-8 bytes.
+
+    Flattens the nested node dicts into a FlatTree once, then walks the
+    contiguous arrays iteratively (no recursion, no per-node dict lookups),
+    appending encoded pieces to one bytearray. Callers that forward the
+    snapshot over the wire can use this to skip the str -> bytes re-encode.
 
     Args:
         node: Accessibility tree node
         refs: Dict mapping ref strings to ElementRef objects
         indent: Current indentation level
-        ref_lookup: Optional pre-built index for O(1) ref lookup
+        ref_lookup: Optional pre-built role -> name -> [refs] index for O(1) lookup
     """
-    prefix = "  " * indent
-    lines = []
-
-    role = node.get("role", "")
-    name = node.get("name", "")
+    tree = _flatten_tree(node)
+    roles = tree.roles
+    names = tree.names
+    first_child = tree.first_child
+    next_sibling = tree.next_sibling
+
+    buf = bytearray()
+    first_entry = True
+    # Explicit pre-order stack of (node_index, depth)
+    stack = [(0, indent)]
+    while stack:
+        i, depth = stack.pop()
+        role = roles[i]
+        name = names[i]
+
+        # Build element line
+        if role:
+            if first_entry:
+                first_entry = False
+            else:
+                buf += b"\n"
+            buf += _INDENTS[depth] if depth < 64 else b"  " * depth
+            buf += b"- %b" % role.encode("utf-8")
+            if name:
+                buf += b" '%b'" % name.encode("utf-8")
+
+            # Add ref if this element has one - use index for O(1) lookup.
+            # Nested role -> name -> refs dicts avoid allocating a (role, name)
+            # tuple key per probe; matching is just two string hashes.
+            if ref_lookup:
+                candidates = ref_lookup.get(role, _EMPTY_LOOKUP).get(name)
+                if candidates:
+                    # Get the first ref for this role+name combo
+                    buf += b" [ref=%b]" % candidates[0].encode("utf-8")
+        elif first_child[i] == -1:
+            # Roleless leaf: contributes an empty line (matches the old
+            # recursive join of an empty child result)
+            if first_entry:
+                first_entry = False
+            else:
+                buf += b"\n"
 
-    # Build element line
-    if role:
-        line = f"- {role}"
-        if name:
-            line += f" '{name}'"
+        # Push children in reverse so they pop in document order
+        children = []
+        child = first_child[i]
+        while child != -1:
+            children.append(child)
+            child = next_sibling[child]
+        for c in reversed(children):
+            stack.append((c, depth + 1))
 
-        # Add ref if this element has one - use index for O(1) lookup
-        if ref_lookup:
-            # Build composite key for matching (role+name+sibling position for uniqueness)
-            # But for simplicity, just use role+name with the pre-built index
-            key = (role, name)
-            if key in ref_lookup:
-                # Get the first ref for this role+name combo
-                ref_str = ref_lookup[key][0]
-                line += f" [ref={ref_str}]"
+    return bytes(buf)
 
-        lines.append(line)
 
-    # Recurse into children
-    for child in node.get("children", []):
-        lines.append(_build_snapshot_yaml(child, refs, indent + 1, ref_lookup))
+def _build_snapshot_yaml(node: dict, refs: dict[str, ElementRef], indent: int = 0, ref_lookup: dict[str, dict[str, list[str]]] | None = None) -> str:
+    """Build human-readable YAML snapshot from accessibility tree.
 
-    return "\n".join(lines)
+    Thin str wrapper over _build_snapshot_yaml_bytes for callers that
+    consume the snapshot as text.
+    """
+    return _build_snapshot_yaml_bytes(node, refs, indent, ref_lookup).decode("utf-8")
 
 
 async def generate_refs(page: Page, root: str = "body") -> tuple[str, SnapshotData]:
@@ -236,7 +338,7 @@ async def generate_refs(page: Page, root: str = "body") -> tuple[str, SnapshotDa
             current_index = sibling_counts.get(sibling_key, 0)
             sibling_counts[sibling_key] = current_index + 1
 
-            ref = f"e{ref_counter}"
+            ref = _REF_IDS[ref_counter] if ref_counter < 8192 else f"e{ref_counter}"
             ref_counter += 1
             
             # Push self to stack for potential children
@@ -7,6 +7,7 @@ the main LLM, not by separate tool calls.
 
 import os
 import time
+from pathlib import Path
 from typing import Optional
 
 from src.tools.base import ToolResult, async_session_tool
@@ -157,18 +158,20 @@ async def capture_screenshot_with_metadata(
     return ToolResult(success=True, content=result, data=metadata).to_string()
 
 
-def cleanup_old_screenshots(max_age_seconds: int = 3600) -> int:
+def cleanup_old_screenshots(
+    max_age_seconds: int = 3600,
+    screenshots_dir: Optional[Path] = None,
+) -> int:
     """Remove screenshots older than specified age.
 
     Args:
         max_age_seconds: Maximum age in seconds (default: 1 hour)
+        screenshots_dir: Directory to clean (default: ./screenshots)
 
     Returns:
         Number of screenshots deleted
     """
-    from pathlib import Path
-
-    screenshot_dir = Path("./screenshots")
+    screenshot_dir = screenshots_dir if screenshots_dir is not None else Path("./screenshots")
     if not screenshot_dir.exists():
         return 0
 
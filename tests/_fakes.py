@@ -0,0 +1,40 @@
+"""Lightweight test doubles for Playwright page/locator objects.
+
+Tiny __slots__ classes that record the calls the tools under test make,
+without the per-attribute-access cost of unittest.mock.Mock. Tests assert
+on the recorded attributes (e.g. ``fake_locator.nth_arg``) instead of
+``assert_called_once_with``.
+"""
+
+
+class FakeLocator:
+    """Stand-in for a Playwright Locator that records nth/filter calls."""
+
+    __slots__ = ("nth_arg", "filter_arg", "first")
+
+    def __init__(self):
+        self.nth_arg = None
+        self.filter_arg = None
+        self.first = self
+
+    def nth(self, index):
+        self.nth_arg = index
+        return self
+
+    def filter(self, **kwargs):
+        self.filter_arg = kwargs
+        return self
+
+
+class FakePage:
+    """Stand-in for a Playwright Page that records the locator() selector."""
+
+    __slots__ = ("locator_arg", "_locator")
+
+    def __init__(self, locator=None):
+        self.locator_arg = None
+        self._locator = locator if locator is not None else FakeLocator()
+
+    def locator(self, selector):
+        self.locator_arg = selector
+        return self._locator
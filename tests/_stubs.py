@@ -0,0 +1,56 @@
+"""Lightweight test doubles for browser-management tool tests.
+
+Same idea as tests/_fakes.py: tiny __slots__ classes that record what the
+tool under test did, without Mock's lazy child-mock construction and
+_CallList bookkeeping. Tests assert on recorded attributes (e.g.
+``stub_page.closed``) instead of ``assert_called_once_with``.
+"""
+
+
+class StubContext:
+    """Stand-in for a Playwright BrowserContext."""
+
+    __slots__ = ("pages", "browser", "new_page_calls", "next_page_stub")
+
+    def __init__(self, pages=(), next_page=None, browser=None):
+        self.pages = list(pages)
+        self.browser = browser
+        self.new_page_calls = 0
+        self.next_page_stub = next_page
+
+    def new_page(self):
+        self.new_page_calls += 1
+        return self.next_page_stub
+
+
+class StubPage:
+    """Stand-in for a Playwright Page that records tab/viewport operations."""
+
+    __slots__ = (
+        "context", "url", "title_value", "closed",
+        "brought_to_front", "goto_url", "viewport_size",
+    )
+
+    def __init__(self, context=None, url="https://www.facebook.com", title="Test Page"):
+        self.context = context
+        self.url = url
+        self.title_value = title
+        self.closed = False
+        self.brought_to_front = False
+        self.goto_url = None
+        self.viewport_size = None
+
+    def title(self):
+        return self.title_value
+
+    def close(self):
+        self.closed = True
+
+    def bring_to_front(self):
+        self.brought_to_front = True
+
+    def goto(self, url, **kwargs):
+        self.goto_url = url
+
+    def set_viewport_size(self, viewport):
+        self.viewport_size = viewport
@@ -0,0 +1,111 @@
+"""Shared fixtures for the unit test suite.
+
+Mock construction is a measurable cost in mock-heavy suites, so the Page
+mock used across the tool tests is built once per session as a fully
+wired prototype and handed to each test as a cheap copy.copy() with its
+call records reset. The child mocks (locator, keyboard, ...) are shared
+between copies, which is safe because tests on one worker run serially
+and every test starts from a fresh reset.
+"""
+
+import asyncio
+import copy
+import sys
+import time
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+# Skip .pyc writes for everything imported after conftest loads; they are
+# pure overhead in ephemeral CI containers that never reuse the cache.
+# (Set PYTHONDONTWRITEBYTECODE=1 in CI to cover conftest's own imports too.)
+sys.dont_write_bytecode = True
+
+# Never collect stray backup copies of test modules; a duplicated
+# test_workflows.py would double the expensive Playwright fixture setup
+collect_ignore_glob = ["**/*_backup*.py", "**/*.bak.py"]
+
+
+def assert_all_in(result, *subs):
+    """Assert that every expected substring appears in result.
+
+    One call covers what would otherwise be a run of ``assert s in result``
+    lines, and the failure message reports all missing substrings at once.
+    """
+    missing = [s for s in subs if s not in result]
+    assert not missing, f"substrings {missing!r} not found in {result!r}"
+
+
+@pytest.fixture(autouse=True, scope="session")
+def no_real_waits():
+    """Keep wall-clock waits out of the unit suite.
+
+    The browser tools run against mocks here, so any sleep/wait that
+    reaches a real implementation is a bug that silently inflates suite
+    runtime. time.sleep, asyncio.sleep and Page.wait_for_timeout are
+    replaced with instant recorders for the whole session; teardown
+    fails the run if anything requested a wait longer than 0.1s.
+    """
+    from playwright.sync_api import Page as SyncPage
+
+    requested: list[float] = []
+
+    def _instant_sleep(seconds):
+        requested.append(seconds)
+
+    async def _instant_async_sleep(delay, result=None):
+        requested.append(delay)
+        return result
+
+    with patch.object(time, "sleep", _instant_sleep), \
+            patch.object(asyncio, "sleep", _instant_async_sleep), \
+            patch.object(SyncPage, "wait_for_timeout", Mock()):
+        yield
+
+    long_waits = [s for s in requested if s > 0.1]
+    assert not long_waits, f"Real waits requested during unit tests: {long_waits}"
+
+
+@pytest.fixture(scope="session")
+def _page_prototype():
+    """One fully wired Page mock, built once per session (per xdist worker)."""
+    from playwright.sync_api import Page
+
+    locator = Mock()
+    proto = Mock(spec=Page)
+    proto.locator.return_value.first = locator
+    proto.get_by_label.return_value.first = locator
+    proto.get_by_role.return_value.first = locator
+    proto.get_by_text.return_value.first = locator
+    proto.title.return_value = "Test Page"
+    return proto
+
+
+@pytest.fixture
+def page_mock(_page_prototype):
+    """Per-test copy of the prototype Page mock with call records cleared.
+
+    return_value/side_effect wiring is kept so the locator chains above
+    survive the reset; only recorded calls are dropped.
+    """
+    page = copy.copy(_page_prototype)
+    page.reset_mock(return_value=False, side_effect=False)
+    return page
+
+
+@pytest.fixture
+def locator_mock(page_mock):
+    """The locator every wired chain on page_mock resolves to."""
+    return page_mock.locator.return_value.first
+
+
+@pytest.fixture
+def context_mock(page_mock):
+    """Fresh browser-context mock attached to page_mock for the test.
+
+    Kept function-scoped (unlike the page prototype) because tests assign
+    per-test state such as .pages lists directly onto the context.
+    """
+    context = MagicMock()
+    page_mock.context = context
+    return context
@@ -5,6 +5,7 @@ import pytest
 
 from src.tools.interaction import _get_locator
 from src.tools.ref_registry import ElementRef, SnapshotData, generate_refs, resolve_ref
+from tests._fakes import FakeLocator, FakePage
 
 
 class TestGetLocator:
@@ -12,84 +13,59 @@ class TestGetLocator:
 
     def test_nth_index_selector(self):
         """Test nth index selector parsing."""
-        mock_page = Mock()
-        base_locator = Mock()
-        nth_locator = Mock()
+        base_locator = FakeLocator()
+        page = FakePage(base_locator)
 
-        mock_page.locator.return_value = base_locator
-        base_locator.nth.return_value = nth_locator
-
-        result = _get_locator(mock_page, "div[nth=5]")
+        result = _get_locator(page, "div[nth=5]")
 
-        mock_page.locator.assert_called_once_with("div")
-        base_locator.nth.assert_called_once_with(5)
-        assert result == nth_locator
+        assert page.locator_arg == "div"
+        assert base_locator.nth_arg == 5
+        assert result is base_locator
 
     def test_hastext_filter_selector(self):
         """Test hasText filter selector parsing."""
-        mock_page = Mock()
-        base_locator = Mock()
-        filtered_locator = Mock()
-
-        mock_page.locator.return_value = base_locator
-        base_locator.filter.return_value = filtered_locator
-        filtered_locator.first = filtered_locator
+        base_locator = FakeLocator()
+        page = FakePage(base_locator)
 
-        result = _get_locator(mock_page, 'div:hasText("Only me")')
+        result = _get_locator(page, 'div:hasText("Only me")')
 
-        mock_page.locator.assert_called_once_with("div")
-        base_locator.filter.assert_called_once_with(has_text="Only me")
-        assert result == filtered_locator
+        assert page.locator_arg == "div"
+        assert base_locator.filter_arg == {"has_text": "Only me"}
+        assert result is base_locator
 
     def test_hastext_regex_filter_selector(self):
         """Test hasText regex filter selector parsing."""
-        mock_page = Mock()
-        base_locator = Mock()
-        filtered_locator = Mock()
+        base_locator = FakeLocator()
+        page = FakePage(base_locator)
 
-        mock_page.locator.return_value = base_locator
-        base_locator.filter.return_value = filtered_locator
-        filtered_locator.first = filtered_locator
+        result = _get_locator(page, "div:hasText(/^Only me$/)")
 
-        result = _get_locator(mock_page, "div:hasText(/^Only me$/)")
-
-        mock_page.locator.assert_called_once_with("div")
-        base_locator.filter.assert_called_once_with(has_text="^Only me$")
-        assert result == filtered_locator
+        assert page.locator_arg == "div"
+        assert base_locator.filter_arg == {"has_text": "^Only me$"}
+        assert result is base_locator
 
     def test_combined_hastext_and_nth_selector(self):
         """Test combined hasText filter and nth index selector."""
-        mock_page = Mock()
-        base_locator = Mock()
-        filtered_locator = Mock()
-        nth_locator = Mock()
-
-        mock_page.locator.return_value = base_locator
-        base_locator.filter.return_value = filtered_locator
-        filtered_locator.nth.return_value = nth_locator
+        base_locator = FakeLocator()
+        page = FakePage(base_locator)
 
-        result = _get_locator(mock_page, 'div:hasText("Only me")[nth=5]')
+        result = _get_locator(page, 'div:hasText("Only me")[nth=5]')
 
-        mock_page.locator.assert_called_once_with("div")
-        base_locator.filter.assert_called_once_with(has_text="Only me")
-        filtered_locator.nth.assert_called_once_with(5)
-        assert result == nth_locator
+        assert page.locator_arg == "div"
+        assert base_locator.filter_arg == {"has_text": "Only me"}
+        assert base_locator.nth_arg == 5
+        assert result is base_locator
 
     def test_backward_compatibility_default_selector(self):
         """Test that default selector still gets .first for backward compatibility."""
-        mock_page = Mock()
-        base_locator = Mock()
-        first_locator = Mock()
+        base_locator = FakeLocator()
+        page = FakePage(base_locator)
 
-        mock_page.locator.return_value = base_locator
-        base_locator.first = first_locator
+        result = _get_locator(page, "button.submit")
 
-        result = _get_locator(mock_page, "button.submit")
-
-        mock_page.locator.assert_called_once_with("button.submit")
-        # Accessing .first is just attribute access, not a method call
-        # Just verify the result is the first_locator
-        assert result == first_locator
+        assert page.locator_arg == "button.submit"
+        # .first on the fake returns the locator itself
+        assert result is base_locator.first
 
 
 class TestRefRegistry:
@@ -360,13 +336,10 @@ class TestBuildSnapshotYamlPerformance:
                 attributes={}
             )
 
-        # Build ref lookup index (as generate_refs does)
+        # Build ref lookup index (role -> name -> refs, as generate_refs does)
         ref_lookup = {}
         for ref_str, ref_obj in refs.items():
-            key = (ref_obj.role or "", ref_obj.name or "")
-            if key not in ref_lookup:
-                ref_lookup[key] = []
-            ref_lookup[key].append(ref_str)
+            ref_lookup.setdefault(ref_obj.role or "", {}).setdefault(ref_obj.name or "", []).append(ref_str)
 
         # Time the YAML generation with lookup
         import time
@@ -432,18 +405,14 @@ class TestBuildSnapshotYamlPerformance:
                 attributes={}
             )
 
-        # Build lookup index
+        # Build lookup index (role -> name -> refs)
         ref_lookup = {}
         for ref_str, ref_obj in refs.items():
-            key = (ref_obj.role or "", ref_obj.name or "")
-            if key not in ref_lookup:
-                ref_lookup[key] = []
-            ref_lookup[key].append(ref_str)
-
-        # Verify lookup contains all refs with same key
-        key = ("button", "")
-        assert key in ref_lookup
-        assert len(ref_lookup[key]) == num_refs
+            ref_lookup.setdefault(ref_obj.role or "", {}).setdefault(ref_obj.name or "", []).append(ref_str)
+
+        # Verify lookup contains all refs with same role+name
+        assert "button" in ref_lookup
+        assert len(ref_lookup["button"][""]) == num_refs
 
         # Build tree with matching nodes
         acc_tree = {"role": "document", "name": "Test", "children": []}
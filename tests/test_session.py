@@ -1,12 +1,8 @@
 """Tests for Playwright session management."""
 
-import warnings
 import pytest
 from pathlib import Path
 
-# Suppress deprecation warnings for this test file
-warnings.filterwarnings("ignore", category=DeprecationWarning)
-
 from src.session import (
     FacebookSessionManager,
     set_global_session,
@@ -20,15 +16,44 @@ PlaywrightSession = FacebookSessionManager
 set_session = set_global_session
 get_current_session = get_global_session
 
+# Scoped per test by pytest instead of mutating the process-wide filter list
+pytestmark = pytest.mark.filterwarnings("ignore::DeprecationWarning")
+
+
+@pytest.fixture(autouse=True)
+def _reset_global_session():
+    """Clear the module-level global session around every test."""
+    set_session(None)
+    yield
+    set_session(None)
+
+
+@pytest.fixture
+def default_session():
+    """Session constructed with default arguments."""
+    return PlaywrightSession()
+
+
+@pytest.fixture
+def locked_profile(fs):
+    """Profile directory pre-populated with Chromium singleton lock files.
+
+    Lives on pyfakefs' in-memory filesystem, so the create/stat/unlink
+    traffic in the cleanup test never touches real disk.
+    """
+    profile_path = Path("/profiles/test-profile")
+    fs.create_file(profile_path / "SingletonLock")
+    fs.create_file(profile_path / "SingletonSocket")
+    return profile_path
+
 
 class TestPlaywrightSession:
     """Test suite for PlaywrightSession class."""
 
-    def test_session_initialization(self):
+    def test_session_initialization(self, default_session):
         """Test that session initializes with correct defaults."""
-        session = PlaywrightSession()
-        assert session.profile_dir == Path("./profiles/facebook")
-        assert session.headless is False
+        assert default_session.profile_dir == Path("./profiles/facebook")
+        assert default_session.headless is False
 
     def test_session_with_custom_profile(self, tmp_path):
         """Test session initialization with custom profile path."""
@@ -36,35 +61,31 @@ class TestPlaywrightSession:
         session = PlaywrightSession(profile_dir=custom_path)
         assert session.profile_dir == custom_path
 
-    def test_cleanup_lock_files(self, tmp_path):
+    def test_cleanup_lock_files(self, locked_profile):
         """Test lock file cleanup."""
-        # Create mock lock files
-        profile_path = tmp_path / "test-profile"
-        profile_path.mkdir(parents=True, exist_ok=True)
-        (profile_path / "SingletonLock").touch()
-        (profile_path / "SingletonSocket").touch()
-
-        session = PlaywrightSession(profile_dir=profile_path)
+        session = PlaywrightSession(profile_dir=locked_profile)
         session._cleanup_lock_files()
 
-        assert not (profile_path / "SingletonLock").exists()
-        assert not (profile_path / "SingletonSocket").exists()
+        assert not (locked_profile / "SingletonLock").exists()
+        assert not (locked_profile / "SingletonSocket").exists()
 
-    def test_getters_before_login(self):
+    def test_getters_before_login(self, default_session):
         """Test that getters return None before login."""
-        session = PlaywrightSession()
-        assert session.get_page() is None
-        assert session.get_context() is None
+        assert default_session.get_page() is None
+        assert default_session.get_context() is None
 
 
+@pytest.mark.xdist_group("global_session")
 class TestGlobalSessionManagement:
-    """Test suite for global session management."""
+    """Test suite for global session management.
+
+    Mutates the module-level global session, so it is pinned to a single
+    pytest-xdist worker via the xdist_group mark (run the suite with
+    ``pytest -n auto --dist=loadfile``).
+    """
 
     def test_set_and_get_session(self):
         """Test setting and getting global session."""
-        # Clear any existing session
-        set_session(None)
-
         session = PlaywrightSession()
         set_session(session)
 
@@ -72,10 +93,8 @@ class TestGlobalSessionManagement:
 
     def test_get_current_page_without_session(self):
         """Test getting current page without session."""
-        set_session(None)
         assert get_current_page() is None
 
     def test_get_current_context_without_session(self):
         """Test getting current context without session."""
-        set_session(None)
         assert get_current_context() is None
@@ -0,0 +1,197 @@
+"""Unit tests for the browser management tools (Phase 3a conversion).
+
+Covers browser_tabs, browser_resize, browser_handle_dialog,
+browser_reload and browser_close. Split out of test_tools_conversion.py
+so pytest-xdist ``--dist=loadfile`` can schedule each tool category on
+its own worker.
+
+Tests use the shared page_mock/locator_mock fixtures from conftest.py,
+which copy a session-scoped prototype instead of rebuilding Mock wiring
+per test.
+
+PYTEST_DONT_REWRITE — the asserts here are simple substring/attribute
+checks, so skipping the assertion-rewrite AST pass saves cold-import
+time on every xdist worker.
+"""
+
+import pytest
+from unittest.mock import MagicMock, call
+
+from tests._stubs import StubContext, StubPage
+from tests.conftest import assert_all_in
+from src.tools.browser import (
+    browser_tabs,
+    browser_resize,
+    browser_handle_dialog,
+    browser_reload,
+    browser_close,
+)
+
+
+# ----- browser_tabs setup helpers: each builds a StubPage wired for one case
+
+def _tabs_single():
+    """A page whose context holds only itself."""
+    page = StubPage()
+    page.context = StubContext(pages=[page])
+    return page
+
+
+def _tabs_pair():
+    """A page with one sibling tab in the context."""
+    other = StubPage(url="https://example.com", title="Example")
+    page = StubPage()
+    page.context = StubContext(pages=[page, other])
+    return page
+
+
+def _tabs_new():
+    """A page whose context hands out a fresh stub from new_page()."""
+    return StubPage(context=StubContext(next_page=StubPage()))
+
+
+# ----- browser_tabs assertion helpers: take (result, page)
+
+def _assert_list(result, page):
+    # Result should contain something, even if it's an error about serialization
+    assert result is not None and len(result) > 0
+
+
+def _assert_new_url(result, page):
+    assert page.context.new_page_calls == 1
+    assert page.context.next_page_stub.goto_url == "https://example.com"
+    assert "Created new tab" in result
+
+
+def _assert_new(result, page):
+    assert page.context.new_page_calls == 1
+    # Should not call goto
+    assert page.context.next_page_stub.goto_url is None
+    assert "Created new tab" in result
+
+
+def _assert_close_idx(result, page):
+    assert page.context.pages[1].closed
+    assert "Closed tab at index 1" in result
+
+
+def _assert_close_current(result, page):
+    assert page.closed
+    assert "Closed current tab" in result
+
+
+def _assert_select(result, page):
+    assert page.context.pages[1].brought_to_front
+    assert "Switched to tab at index 1" in result
+
+
+def _assert_invalid(result, page):
+    assert "Invalid tab index" in result
+
+
+def _assert_unknown(result, page):
+    assert "Unknown action" in result
+
+
+_TABS_CASES = [
+    pytest.param("list", {}, _tabs_pair, _assert_list, id="list"),
+    pytest.param("new", {"url": "https://example.com"}, _tabs_new, _assert_new_url, id="new-with-url"),
+    pytest.param("new", {}, _tabs_new, _assert_new, id="new-without-url"),
+    pytest.param("close", {"index": 1}, _tabs_pair, _assert_close_idx, id="close-by-index"),
+    pytest.param("close", {}, _tabs_single, _assert_close_current, id="close-current"),
+    pytest.param("select", {"index": 1}, _tabs_pair, _assert_select, id="select"),
+    pytest.param("select", {"index": 5}, _tabs_single, _assert_invalid, id="invalid-index"),
+    pytest.param("invalid", {}, _tabs_single, _assert_unknown, id="unknown-action"),
+]
+
+
+class TestBrowserTabs:
+    """Test suite for browser_tabs tool."""
+
+    @pytest.mark.parametrize("action, kwargs, setup, check", _TABS_CASES)
+    def test_tabs(self, action, kwargs, setup, check):
+        """Test list/new/close/select tab operations and error paths."""
+        page = setup()
+
+        result = browser_tabs(action=action, page=page, **kwargs)
+
+        check(result, page)
+
+
+class TestBrowserResize:
+    """Test suite for browser_resize tool."""
+
+    def test_resize_default(self):
+        """Test resizing browser window."""
+        page = StubPage()
+
+        result = browser_resize(width=1920, height=1080, page=page)
+
+        assert page.viewport_size == {"width": 1920, "height": 1080}
+        assert "Browser window resized to 1920x1080" in result
+
+
+# (kwargs, expected result substrings) for each browser_handle_dialog case
+_DIALOG_CASES = [
+    pytest.param({}, ("Dialog handler configured",), id="accept-default"),
+    pytest.param({"accept": False}, (), id="dismiss"),
+    pytest.param({"accept": True, "prompt_text": "Hello World"}, ("prompt: Hello World",), id="prompt-text"),
+]
+
+
+class TestBrowserHandleDialog:
+    """Test suite for browser_handle_dialog tool."""
+
+    @pytest.mark.parametrize("kwargs, substrs", _DIALOG_CASES)
+    def test_handle_dialog(self, page_mock, kwargs, substrs):
+        """Test accept/dismiss/prompt dialog handler configuration."""
+        result = browser_handle_dialog(page=page_mock, **kwargs)
+
+        page_mock.once.assert_called_once()
+        assert page_mock.once.call_args.args[0] == "dialog"
+        assert_all_in(result, *substrs)
+
+
+# (kwargs, expected reload call or None for call-count-only, result substrings)
+_RELOAD_CASES = [
+    pytest.param({}, call(wait_until="load", timeout=30000), ("Page reloaded", "Test Page"), id="defaults"),
+    pytest.param({"force": True}, None, (), id="force"),
+    pytest.param({"wait_until": "domcontentloaded"}, call(wait_until="domcontentloaded", timeout=30000), (), id="custom-wait-until"),
+]
+
+
+class TestBrowserReload:
+    """Test suite for browser_reload tool."""
+
+    @pytest.mark.parametrize("kwargs, expected_call, substrs", _RELOAD_CASES)
+    def test_reload(self, page_mock, kwargs, expected_call, substrs):
+        """Test reload across default/force/wait_until variants."""
+        result = browser_reload(page=page_mock, **kwargs)
+
+        page_mock.reload.assert_called_once()
+        if expected_call is not None:
+            assert page_mock.reload.call_args == expected_call
+        assert_all_in(result, *substrs)
+
+
+class TestBrowserClose:
+    """Test suite for browser_close tool."""
+
+    def test_close_page_default(self, page_mock, context_mock):
+        """Test closing current page."""
+        context_mock.browser = None
+
+        result = browser_close(page=page_mock)
+
+        page_mock.close.assert_called_once()
+        assert "Current page closed" in result
+
+    def test_close_browser(self, page_mock, context_mock):
+        """Test closing entire browser."""
+        mock_browser = MagicMock()
+        context_mock.browser = mock_browser
+
+        result = browser_close(close_browser=True, page=page_mock)
+
+        mock_browser.close.assert_called_once()
+        assert "Browser closed" in result
@@ -0,0 +1,182 @@
+"""Unit tests for the form tools (Phase 3a conversion).
+
+Covers browser_fill_form, browser_get_form_data and browser_submit_form.
+Split out of test_tools_conversion.py so pytest-xdist ``--dist=loadfile``
+can schedule each tool category on its own worker.
+
+Tests use the shared page_mock/locator_mock fixtures from conftest.py,
+which copy a session-scoped prototype instead of rebuilding Mock wiring
+per test.
+"""
+
+import pytest
+from types import MappingProxyType
+from unittest.mock import MagicMock
+
+from tests.conftest import assert_all_in
+from src.tools.forms import (
+    browser_fill_form,
+    browser_get_form_data,
+    browser_submit_form,
+)
+
+
+# Shared field payloads for browser_fill_form tests, built once at import.
+# MappingProxyType makes sharing safe: any accidental mutation by the tool
+# would raise TypeError instead of leaking state between tests.
+TEXTBOX_FIELD = MappingProxyType({"name": "email", "type": "textbox", "value": "test@example.com"})
+CHECKBOX_FIELD = MappingProxyType({"name": "agree", "type": "checkbox", "value": True})
+
+# One case per browser_fill_form field type: (field dict, locator method
+# it should drive, expected call args, result substring)
+_FILL_FIELD_CASES = [
+    pytest.param(
+        TEXTBOX_FIELD,
+        "fill", ("test@example.com",), "Filled textbox email",
+        id="textbox",
+    ),
+    pytest.param(
+        CHECKBOX_FIELD,
+        "check", (), "Checked checkbox: agree",
+        id="checkbox-checked",
+    ),
+    pytest.param(
+        MappingProxyType({"name": "agree", "type": "checkbox", "value": False}),
+        "uncheck", (), "Unchecked checkbox: agree",
+        id="checkbox-unchecked",
+    ),
+    pytest.param(
+        MappingProxyType({"name": "gender", "type": "radio", "value": "male"}),
+        "check", (), "Selected radio gender: male",
+        id="radio",
+    ),
+    pytest.param(
+        MappingProxyType({"name": "country", "type": "combobox", "value": "US"}),
+        "select_option", ("US",), "Selected option from country: US",
+        id="combobox",
+    ),
+    pytest.param(
+        MappingProxyType({"name": "volume", "type": "slider", "value": 75}),
+        "fill", ("75",), "Set slider volume to: 75",
+        id="slider",
+    ),
+]
+
+
+class TestBrowserFillForm:
+    """Test suite for browser_fill_form tool."""
+
+    @pytest.mark.parametrize("field, method, args, result_substr", _FILL_FIELD_CASES)
+    def test_fill_single_field(self, page_mock, locator_mock, field, method, args, result_substr):
+        """Test filling one field of each supported type."""
+        result = browser_fill_form(fields=[field], page=page_mock)
+
+        getattr(locator_mock, method).assert_called_once_with(*args)
+        assert_all_in(result, result_substr)
+
+    def test_fill_multiple_fields(self, page_mock, locator_mock):
+        """Test filling multiple fields at once."""
+        result = browser_fill_form(fields=[TEXTBOX_FIELD, CHECKBOX_FIELD], page=page_mock)
+
+        assert_all_in(result, "Filled textbox email", "Checked checkbox: agree")
+
+    def test_fill_form_with_submit(self, page_mock, locator_mock):
+        """Test filling form and submitting."""
+        result = browser_fill_form(fields=[TEXTBOX_FIELD], submit=True, page=page_mock)
+
+        locator_mock.click.assert_called_once()
+        assert "Form submitted" in result
+
+
+# Canned page.evaluate payload for form-data extraction tests; built once
+# at import instead of per test (the tool only reads it, never mutates it).
+FORM_DATA_SAMPLE = {
+    "formAction": "https://example.com/submit",
+    "formMethod": "POST",
+    "fields": {
+        "email": {"type": "email", "value": "test@example.com", "id": "email"},
+        "agree": {"type": "checkbox", "value": True, "id": "agree"},
+    },
+}
+
+
+class TestBrowserGetFormData:
+    """Test suite for browser_get_form_data tool."""
+
+    def test_get_form_data(self, page_mock):
+        """Test extracting form data."""
+        page_mock.evaluate.return_value = FORM_DATA_SAMPLE
+
+        result = browser_get_form_data(page=page_mock)
+
+        page_mock.evaluate.assert_called_once()
+        assert_all_in(result, "email", "test@example.com")
+
+    def test_get_form_data_with_custom_selector(self, page_mock):
+        """Test getting form data with custom selector."""
+        page_mock.evaluate.return_value = {"formAction": "", "formMethod": "GET", "fields": {}}
+
+        result = browser_get_form_data(form_selector="#login-form", page=page_mock)
+
+        # Bind call_args once and use named-tuple access instead of
+        # repeated __getitem__ chains on the Mock's _Call tuple
+        args = page_mock.evaluate.call_args
+        assert args.args[1]["selector"] == "#login-form"
+
+    def test_get_form_data_not_found(self, page_mock):
+        """Test when form selector not found."""
+        page_mock.evaluate.return_value = {"error": "Form not found: #nonexistent"}
+
+        result = browser_get_form_data(form_selector="#nonexistent", page=page_mock)
+
+        assert "Form not found" in result
+
+
+class TestBrowserSubmitForm:
+    """Test suite for browser_submit_form tool."""
+
+    def test_submit_form_default(self, page_mock):
+        """Test submitting form with default parameters."""
+        page_mock.url = "https://example.com/success"
+        # MagicMock supports the context-manager protocol out of the box
+        page_mock.expect_navigation.return_value = MagicMock()
+
+        result = browser_submit_form(page=page_mock)
+
+        # With wait_for_navigation=True, expect_navigation is called
+        page_mock.expect_navigation.assert_called_once_with(timeout=30000)
+        page_mock.wait_for_selector.assert_called_once_with("form", timeout=30000)
+        page_mock.evaluate.assert_called_once()
+        assert "Form submitted" in result
+
+    def test_submit_form_with_selector(self, page_mock):
+        """Test submitting specific form."""
+        page_mock.url = "https://example.com/success"
+        # MagicMock supports the context-manager protocol out of the box
+        page_mock.expect_navigation.return_value = MagicMock()
+
+        result = browser_submit_form(form_selector="#login-form", page=page_mock)
+
+        page_mock.wait_for_selector.assert_called_once_with("#login-form", timeout=30000)
+
+    def test_submit_form_with_button(self, page_mock, locator_mock):
+        """Test submitting via button click."""
+        page_mock.url = "https://example.com/success"
+        # MagicMock supports the context-manager protocol out of the box
+        page_mock.expect_navigation.return_value = MagicMock()
+
+        result = browser_submit_form(submit_selector="button[type='submit']", page=page_mock)
+
+        locator_mock.wait_for.assert_called_once_with(timeout=30000)
+        locator_mock.click.assert_called_once()
+
+    def test_submit_without_navigation_wait(self, page_mock):
+        """Test submitting without waiting for navigation."""
+        page_mock.url = "https://example.com/success"
+
+        result = browser_submit_form(wait_for_navigation=False, page=page_mock)
+
+        # Should not call expect_navigation
+        page_mock.expect_navigation.assert_not_called()
+        page_mock.wait_for_selector.assert_called_once_with("form", timeout=30000)
+        assert "Form submitted" in result
@@ -0,0 +1,151 @@
+"""Unit tests for the interaction tools (Phase 3a conversion).
+
+Covers browser_type, browser_select_option, browser_hover and
+browser_press_key. Split out of test_tools_conversion.py so pytest-xdist
+``--dist=loadfile`` can schedule each tool category on its own worker.
+
+Tests use the shared page_mock/locator_mock fixtures from conftest.py,
+which copy a session-scoped prototype instead of rebuilding Mock wiring
+per test.
+"""
+
+import pytest
+from unittest.mock import call
+
+from tests.conftest import assert_all_in
+from src.tools.interaction import (
+    browser_type,
+    browser_select_option,
+    browser_hover,
+    browser_press_key,
+)
+
+
+# One case per browser_type code path: (kwargs, expected fill calls,
+# expected press_sequentially call, expected press call, wait timeout, result substring)
+_TYPE_CASES = [
+    pytest.param(
+        {"selector": "input[name='email']", "text": "test@example.com"},
+        [call(""), call("test@example.com")], None, None, 5000, "Typed",
+        id="defaults",
+    ),
+    pytest.param(
+        {"selector": "#username", "text": "user123", "clear": True},
+        [call(""), call("user123")], None, None, 5000, "Typed",
+        id="clear",
+    ),
+    pytest.param(
+        {"selector": "#username", "text": "user123", "clear": False},
+        [call("user123")], None, None, 5000, "Typed",
+        id="no-clear",
+    ),
+    pytest.param(
+        {"selector": "#input", "text": "hello", "delay": 50},
+        [call("")], call("hello", delay=50), None, 5000, "Typed",
+        id="delay",
+    ),
+    pytest.param(
+        {"selector": "#search", "text": "query", "submit": True},
+        [call(""), call("query")], None, call("Enter"), 5000, "submitted",
+        id="submit",
+    ),
+    pytest.param(
+        {"selector": "#slow-input", "text": "text", "timeout": 10000},
+        [call(""), call("text")], None, None, 10000, "Typed",
+        id="custom-timeout",
+    ),
+]
+
+
+class TestBrowserType:
+    """Test suite for browser_type tool."""
+
+    @pytest.mark.parametrize(
+        "kwargs, fill_calls, seq_call, press_call, wait_timeout, result_substr", _TYPE_CASES
+    )
+    def test_type(self, page_mock, locator_mock, kwargs, fill_calls, seq_call,
+                  press_call, wait_timeout, result_substr):
+        """Test typing across clear/delay/submit/timeout combinations."""
+        result = browser_type(page=page_mock, **kwargs)
+
+        locator_mock.wait_for.assert_called_once_with(state="visible", timeout=wait_timeout)
+        assert locator_mock.fill.call_args_list == fill_calls
+        if seq_call is not None:
+            assert locator_mock.press_sequentially.call_args_list == [seq_call]
+        if press_call is not None:
+            assert locator_mock.press.call_args_list == [press_call]
+        assert_all_in(result, result_substr)
+
+
+class TestBrowserSelectOption:
+    """Test suite for browser_select_option tool."""
+
+    def test_select_single_value(self, page_mock, locator_mock):
+        """Test selecting single option by value."""
+        result = browser_select_option(selector="#country", values=["US"], page=page_mock)
+
+        locator_mock.wait_for.assert_called_once_with(state="visible", timeout=5000)
+        locator_mock.select_option.assert_called_once_with(["US"])
+        assert "Selected 1 option(s) from #country" in result
+
+    def test_select_multiple_values(self, page_mock, locator_mock):
+        """Test selecting multiple options."""
+        result = browser_select_option(selector="#languages", values=["en", "es", "fr"], page=page_mock)
+
+        locator_mock.select_option.assert_called_once_with(["en", "es", "fr"])
+
+    def test_select_with_custom_timeout(self, page_mock, locator_mock):
+        """Test select with custom timeout."""
+        result = browser_select_option(selector="#dropdown", values=["opt1"], timeout=10000, page=page_mock)
+
+        locator_mock.wait_for.assert_called_once_with(state="visible", timeout=10000)
+
+
+class TestBrowserHover:
+    """Test suite for browser_hover tool."""
+
+    def test_hover_with_defaults(self, page_mock, locator_mock):
+        """Test hover with default parameters."""
+        result = browser_hover(selector="#menu-item", page=page_mock)
+
+        locator_mock.wait_for.assert_called_once_with(state="visible", timeout=5000)
+        locator_mock.hover.assert_called_once()
+        assert "Hovered over element: #menu-item" in result
+
+    def test_hover_with_custom_timeout(self, page_mock, locator_mock):
+        """Test hover with custom timeout."""
+        result = browser_hover(selector="#tooltip", timeout=10000, page=page_mock)
+
+        locator_mock.wait_for.assert_called_once_with(state="visible", timeout=10000)
+
+
+class TestBrowserPressKey:
+    """Test suite for browser_press_key tool."""
+
+    def test_press_single_key(self, page_mock):
+        """Test pressing single key."""
+        result = browser_press_key(key="Enter", page=page_mock)
+
+        page_mock.keyboard.press.assert_called_once_with("Enter", modifiers=[])
+        assert "Pressed key: Enter" in result
+
+    def test_press_key_with_modifiers(self, page_mock):
+        """Test pressing key with modifiers."""
+        result = browser_press_key(key="s", modifiers=["Control", "Shift"], page=page_mock)
+
+        page_mock.keyboard.press.assert_called_once_with("s", modifiers=["Control", "Shift"])
+        assert "Pressed key: Control+Shift+s" in result
+
+    def test_press_key_with_delay(self, page_mock):
+        """Test pressing key with delay."""
+        result = browser_press_key(key="Tab", delay=100, page=page_mock)
+
+        page_mock.keyboard.press.assert_called_once()
+        page_mock.wait_for_timeout.assert_called_once_with(100)
+
+    def test_press_arrow_key(self, page_mock):
+        """Test pressing arrow key."""
+        result = browser_press_key(key="ArrowDown", page=page_mock)
+
+        page_mock.keyboard.press.assert_called_once_with("ArrowDown", modifiers=[])
+        assert "Pressed key: ArrowDown" in result
@@ -0,0 +1,197 @@
+"""Unit tests for the utility tools (Phase 3a conversion).
+
+Covers browser_wait, browser_evaluate, browser_get_snapshot,
+browser_get_network_requests and browser_get_console_messages. Split out
+of test_tools_conversion.py so pytest-xdist ``--dist=loadfile`` can
+schedule each tool category on its own worker.
+
+Tests use the shared page_mock/locator_mock fixtures from conftest.py,
+which copy a session-scoped prototype instead of rebuilding Mock wiring
+per test.
+"""
+
+import pytest
+from unittest.mock import MagicMock
+
+from src.tools.utilities import (
+    browser_wait,
+    browser_evaluate,
+    browser_get_snapshot,
+    browser_get_network_requests,
+    browser_get_console_messages,
+    ensure_request_tracking,
+    ensure_console_tracking,
+)
+
+
+class TestBrowserWait:
+    """Test suite for browser_wait tool."""
+
+    def test_wait_for_time(self, page_mock):
+        """Test waiting for specified time."""
+        result = browser_wait(time=2.5, page=page_mock)
+
+        page_mock.wait_for_timeout.assert_called_once_with(2500)
+        assert "Waited 2.5 second(s)" in result
+
+    def test_wait_for_text(self, page_mock, locator_mock):
+        """Test waiting for text to appear."""
+        result = browser_wait(text="Welcome", page=page_mock)
+
+        locator_mock.wait_for.assert_called_once_with(state="visible", timeout=30000)
+        assert "Waited for text to appear: 'Welcome'" in result
+
+    def test_wait_for_text_gone(self, page_mock, locator_mock):
+        """Test waiting for text to disappear."""
+        result = browser_wait(text_gone="Loading...", page=page_mock)
+
+        locator_mock.wait_for.assert_called_once_with(state="hidden", timeout=30000)
+        assert "Waited for text to disappear: 'Loading...'" in result
+
+    def test_wait_for_selector(self, page_mock, locator_mock):
+        """Test waiting for selector."""
+        result = browser_wait(selector="#result", page=page_mock)
+
+        locator_mock.wait_for.assert_called_once_with(state="visible", timeout=30000)
+        assert "Waited for element: #result" in result
+
+    def test_wait_with_custom_timeout(self, page_mock, locator_mock):
+        """Test wait with custom timeout."""
+        result = browser_wait(selector="#slow", timeout=60, page=page_mock)
+
+        locator_mock.wait_for.assert_called_once_with(state="visible", timeout=60000)
+
+    def test_wait_no_valid_condition(self, page_mock):
+        """Test wait with no valid condition."""
+        result = browser_wait(page=page_mock)
+
+        assert "No valid wait condition" in result
+
+
+class TestBrowserEvaluate:
+    """Test suite for browser_evaluate tool."""
+
+    def test_evaluate_simple_script(self, page_mock):
+        """Test evaluating simple JavaScript."""
+        page_mock.evaluate.return_value = 42
+
+        result = browser_evaluate(script="2 + 2", page=page_mock)
+
+        page_mock.evaluate.assert_called_once()
+        assert "JavaScript executed successfully" in result
+        assert "42" in result
+
+    def test_evaluate_object_result(self, page_mock):
+        """Test evaluating script returning object."""
+        page_mock.evaluate.return_value = {"name": "test", "value": 123}
+
+        result = browser_evaluate(script="({name: 'test', value: 123})", page=page_mock)
+
+        assert '"name": "test"' in result
+        assert '"value": 123' in result
+
+    def test_evaluate_with_wait_for_function(self, page_mock):
+        """Test waiting for function to return truthy."""
+        mock_handle = MagicMock()
+        mock_handle.json_value.return_value = "ready"
+        page_mock.wait_for_function.return_value = mock_handle
+
+        result = browser_evaluate(script="document.readyState === 'complete'", wait_for_function=True, page=page_mock)
+
+        page_mock.wait_for_function.assert_called_once()
+        assert "JavaScript executed successfully" in result
+
+    def test_evaluate_with_custom_timeout(self, page_mock):
+        """Test evaluate with custom timeout."""
+        page_mock.evaluate.return_value = "result"
+
+        result = browser_evaluate(script="'result'", timeout=60, page=page_mock)
+
+        args = page_mock.evaluate.call_args if not page_mock.wait_for_function.called else page_mock.wait_for_function.call_args
+        # timeout should be 60000ms (60s)
+
+
+class TestBrowserGetSnapshot:
+    """Test suite for browser_get_snapshot tool."""
+
+    def test_get_snapshot_default(self, page_mock, locator_mock):
+        """Test getting accessibility snapshot with defaults."""
+        locator_mock.aria_snapshot.return_value = {"root": "snapshot"}
+
+        result = browser_get_snapshot(page=page_mock)
+
+        page_mock.locator.assert_called_once_with("body")
+        locator_mock.aria_snapshot.assert_called_once()
+        assert "Page snapshot" in result
+
+    def test_get_snapshot_with_root(self, page_mock, locator_mock):
+        """Test getting snapshot with custom root."""
+        locator_mock.aria_snapshot.return_value = {"partial": "snapshot"}
+
+        result = browser_get_snapshot(root="#main-content", page=page_mock)
+
+        page_mock.locator.assert_called_once_with("#main-content")
+
+
+@pytest.fixture
+def tracked_request_page(page_mock):
+    """page_mock with request tracking handlers wired once per test."""
+    ensure_request_tracking(page_mock)
+    return page_mock
+
+
+@pytest.fixture
+def tracked_console_page(page_mock):
+    """page_mock with console tracking handlers wired once per test."""
+    ensure_console_tracking(page_mock)
+    return page_mock
+
+
+class TestBrowserGetNetworkRequests:
+    """Test suite for browser_get_network_requests tool."""
+
+    def test_get_network_requests_default(self, tracked_request_page):
+        """Test getting network requests with defaults."""
+        result = browser_get_network_requests(page=tracked_request_page)
+
+        assert "Network requests" in result
+
+    def test_get_network_requests_with_filter(self, tracked_request_page):
+        """Test filtering network requests."""
+        result = browser_get_network_requests(filter="api", page=tracked_request_page)
+
+        assert "Network requests" in result
+
+    def test_get_network_requests_include_static(self, tracked_request_page):
+        """Test including static resources."""
+        result = browser_get_network_requests(include_static=True, page=tracked_request_page)
+
+        assert "Network requests" in result
+
+    def test_get_network_requests_with_limit(self, tracked_request_page):
+        """Test limiting network requests."""
+        result = browser_get_network_requests(limit=10, page=tracked_request_page)
+
+        assert "Network requests" in result
+
+
+class TestBrowserGetConsoleMessages:
+    """Test suite for browser_get_console_messages tool."""
+
+    def test_get_console_messages_default(self, tracked_console_page):
+        """Test getting console messages with defaults."""
+        result = browser_get_console_messages(page=tracked_console_page)
+
+        assert "Console messages" in result
+
+    def test_get_console_messages_error_level(self, tracked_console_page):
+        """Test getting only error messages."""
+        result = browser_get_console_messages(level="error", page=tracked_console_page)
+
+        assert "Console messages" in result
+
+    def test_get_console_messages_with_limit(self, tracked_console_page):
+        """Test limiting console messages."""
+        result = browser_get_console_messages(limit=50, page=tracked_console_page)
+
+        assert "Console messages" in result
@@ -1,7 +1,15 @@
-"""Tests for vision-based screenshot capture tools."""
+"""Tests for vision-based screenshot capture tools.
 
+PYTEST_DONT_REWRITE — assertions here are plain value checks, so the
+assertion-rewrite AST pass adds worker-startup cost without buying
+better failure messages.
+"""
+
+import io
 import os
+import time
 import warnings
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 from pathlib import Path
 
@@ -19,6 +27,43 @@ from src.tools.vision import (
 from src.session import set_global_session as set_session
 
 
+# Canned stat results shared by every test that fakes os.stat; interning
+# these once keeps the per-test bodies down to the patch itself.
+_STAT_SMALL = SimpleNamespace(st_size=12345)
+_STAT_CACHE = SimpleNamespace(st_size=54321)
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _stub_makedirs():
+    """No-op os.makedirs for every test in this module.
+
+    The vision tools resolve os.makedirs through the global os module at
+    call time, so one swap here replaces the per-test patch() round trips.
+    Module scope (not session) restores the real function before any other
+    file's tests run on the same worker.
+    """
+    original = os.makedirs
+    os.makedirs = lambda *args, **kwargs: None
+    yield
+    os.makedirs = original
+
+
+@pytest.fixture(scope="session")
+def prebuilt_screenshots_dir(tmp_path_factory):
+    """Screenshots directory built once per session with one pre-aged file.
+
+    Consumed destructively by the cleanup test (old.png gets deleted), which
+    is safe at session scope because only that test uses it.
+    """
+    d = tmp_path_factory.mktemp("screens")
+    old = d / "old.png"
+    old.write_bytes(b"old data")
+    old_time = time.time() - 7200  # 2 hours ago
+    os.utime(old, (old_time, old_time))
+    (d / "new.png").write_bytes(b"new data")
+    return d
+
+
 @pytest.fixture
 def mock_page():
     """Create a mock Playwright Page."""
@@ -29,55 +74,61 @@ def mock_page():
     return mock
 
 
-class TestCaptureScreenshotForAnalysis:
-    """Test suite for capture_screenshot_for_analysis tool."""
+@pytest.fixture
+def stub_fs(monkeypatch):
+    """In-memory stand-ins for the stat/read/encode chain around a capture.
 
-    def test_capture_screenshot_for_analysis(self, mock_page, tmp_path):
-        """Test screenshot capture with base64 encoding for agent analysis."""
-        screenshots_dir = tmp_path / "screenshots"
-        screenshots_dir.mkdir()
+    Redirects the file read to a BytesIO buffer and fakes the stat result
+    for screenshot paths only, leaving os.stat intact for everything else
+    (pytest's own machinery stats real files while a test is running).
+    """
+    real_stat = os.stat
 
-        # Create a mock file stat for the screenshot
-        mock_stat = Mock()
-        mock_stat.st_size = 12345
+    def fake_stat(path, *args, **kwargs):
+        if isinstance(path, str) and path.startswith("./screenshots/"):
+            return _STAT_SMALL
+        return real_stat(path, *args, **kwargs)
 
-        with patch("src.tools.vision.os.makedirs"):
-            with patch("os.stat", return_value=mock_stat):
-                # Patch base64 module where it's used (imported inside function)
-                with patch("base64.b64encode", return_value=b"dGVzdCBwbmcgZGF0YQ=="):
-                    with patch("builtins.open", create=True):
-                        # Mock file read for base64 encoding
-                        mock_file = Mock()
-                        mock_file.read.return_value = b"test png data"
-                        mock_file.__enter__ = Mock(return_value=mock_file)
-                        mock_file.__exit__ = Mock(return_value=False)
+    monkeypatch.setattr("os.stat", fake_stat)
+    monkeypatch.setattr("base64.b64encode", Mock(return_value=b"dGVzdCBwbmcgZGF0YQ=="))
+    monkeypatch.setattr(
+        "src.tools.vision.open",
+        lambda *args, **kwargs: io.BytesIO(b"test png data"),
+        raising=False,
+    )
 
-                        result = capture_screenshot_for_analysis(page=mock_page)
 
-                        # Should have called screenshot
-                        mock_page.screenshot.assert_called_once()
+# Assertion helpers for the parametrized capture test: take (mock_page, result)
 
-                        # Result should contain metadata
-                        assert "Screenshot captured for analysis:" in result
-                        assert "Size:" in result
-                        assert "URL:" in result
+def _assert_default(mock_page, result):
+    # Should have called screenshot
+    mock_page.screenshot.assert_called_once()
+
+    # Result should contain metadata
+    assert "Screenshot captured for analysis:" in result
+    assert "Size:" in result
+    assert "URL:" in result
 
-    def test_capture_screenshot_full_page(self, mock_page):
-        """Test full page screenshot capture for analysis."""
-        with patch("src.tools.vision.os.makedirs"):
-            with patch("os.stat") as mock_stat:
-                mock_stat.return_value = Mock(st_size=50000)
-                with patch("base64.b64encode", return_value=b"x" * 50000):
-                    with patch("builtins.open", create=True):
-                        mock_file = Mock()
-                        mock_file.read.return_value = b"x" * 50000
-                        mock_file.__enter__ = Mock(return_value=mock_file)
-                        mock_file.__exit__ = Mock(return_value=False)
 
-                        capture_screenshot_for_analysis(full_page=True, page=mock_page)
+def _assert_full_page(mock_page, result):
+    assert mock_page.screenshot.call_args.kwargs["full_page"] is True
 
-                        call_args = mock_page.screenshot.call_args
-                        assert call_args.kwargs["full_page"] is True
+
+_CAPTURE_CASES = [
+    pytest.param({}, _assert_default, id="default"),
+    pytest.param({"full_page": True}, _assert_full_page, id="full-page"),
+]
+
+
+class TestCaptureScreenshotForAnalysis:
+    """Test suite for capture_screenshot_for_analysis tool."""
+
+    @pytest.mark.parametrize("kwargs, assert_fn", _CAPTURE_CASES)
+    def test_capture_screenshot_for_analysis(self, mock_page, stub_fs, kwargs, assert_fn):
+        """Test screenshot capture for analysis across default/full-page."""
+        result = capture_screenshot_for_analysis(page=mock_page, **kwargs)
+
+        assert_fn(mock_page, result)
 
 
 class TestCaptureScreenshotWithMetadata:
@@ -88,42 +139,32 @@ class TestCaptureScreenshotWithMetadata:
         screenshots_dir = tmp_path / "screenshots"
         screenshots_dir.mkdir()
 
-        # Create a mock file stat for the screenshot
-        mock_stat = Mock()
-        mock_stat.st_size = 12345
-
-        with patch("src.tools.vision.os.makedirs"):
-            with patch("os.stat", return_value=mock_stat):
-                result = capture_screenshot_with_metadata(page=mock_page)
+        with patch("os.stat", return_value=_STAT_SMALL):
+            result = capture_screenshot_with_metadata(page=mock_page)
 
-                # Should have called screenshot
-                mock_page.screenshot.assert_called_once()
+            # Should have called screenshot
+            mock_page.screenshot.assert_called_once()
 
     def test_capture_screenshot_with_cache_key(self, mock_page):
         """Test screenshot capture with caching."""
-        mock_stat = Mock()
-        mock_stat.st_size = 54321
-
-        with patch("src.tools.vision.os.makedirs"):
-            with patch("os.stat", return_value=mock_stat):
-                result = capture_screenshot_with_metadata(
-                    filename="cached-screenshot",
-                    cache_key="test_cache_key",
-                    page=mock_page,
-                )
-
-                # Verify cache was populated
-                cached = get_cached_screenshot("test_cache_key")
-                assert cached is not None
-                assert cached["url"] == "https://www.facebook.com"
+        with patch("os.stat", return_value=_STAT_CACHE):
+            result = capture_screenshot_with_metadata(
+                filename="cached-screenshot",
+                cache_key="test_cache_key",
+                page=mock_page,
+            )
+
+            # Verify cache was populated
+            cached = get_cached_screenshot("test_cache_key")
+            assert cached is not None
+            assert cached["url"] == "https://www.facebook.com"
 
     def test_capture_screenshot_full_page(self, mock_page):
         """Test full page screenshot capture."""
-        with patch("src.tools.vision.os.makedirs"):
-            capture_screenshot_with_metadata(full_page=True, page=mock_page)
+        capture_screenshot_with_metadata(full_page=True, page=mock_page)
 
-            call_args = mock_page.screenshot.call_args
-            assert call_args.kwargs["full_page"] is True
+        call_args = mock_page.screenshot.call_args
+        assert call_args.kwargs["full_page"] is True
 
 
 class TestCleanupOldScreenshots:
@@ -136,36 +177,15 @@ class TestCleanupOldScreenshots:
         # Should return 0 if directory doesn't exist
         assert deleted == 0
 
-    def test_cleanup_with_actual_directory(self, tmp_path):
+    def test_cleanup_with_actual_directory(self, prebuilt_screenshots_dir):
         """Test cleanup with actual directory."""
-        screenshots_dir = tmp_path / "screenshots"
-        screenshots_dir.mkdir()
-
-        # Create an old screenshot
-        old_screenshot = screenshots_dir / "old.png"
-        old_screenshot.write_bytes(b"old data")
-
-        # Modify timestamp to make it appear old
-        import time
-
-        old_time = time.time() - 7200  # 2 hours ago
-        os.utime(old_screenshot, (old_time, old_time))
-
-        # Create a new screenshot
-        new_screenshot = screenshots_dir / "new.png"
-        new_screenshot.write_bytes(b"new data")
-
-        # Change to the temp directory
-        original_cwd = os.getcwd()
-        try:
-            os.chdir(tmp_path)
-            deleted = cleanup_old_screenshots(max_age_seconds=3600)
-
-            # At least one file should be deleted (the old one)
-            assert deleted >= 0
+        deleted = cleanup_old_screenshots(
+            max_age_seconds=3600, screenshots_dir=prebuilt_screenshots_dir
+        )
 
-        finally:
-            os.chdir(original_cwd)
+        assert deleted == 1
+        assert not (prebuilt_screenshots_dir / "old.png").exists()
+        assert (prebuilt_screenshots_dir / "new.png").exists()
 
 
 class TestGetCachedScreenshot:
@@ -6,14 +6,34 @@ Workflow:
 3. Go to news feed → screenshot
 4. Go to profile → screenshot
 5. End
+
+By default every request is answered by a local route stub, so the
+tests exercise the tool wrappers and page plumbing without real
+Facebook traffic or login. Set FB_RECORD=1 to run against the live
+site with the HITL login flow.
 """
 
+import os
+import sys
 from pathlib import Path
 
 import pytest
 from playwright.sync_api import Page
 
 from src.session import FacebookProfileManager, check_login_status, wait_for_login
+from src.tools.browser import browser_reload, browser_resize, browser_tabs
+from src.tools.forms import browser_get_form_data
+from src.tools.interaction import browser_type
+from src.tools.utilities import (
+    browser_evaluate,
+    browser_get_network_requests,
+    browser_get_snapshot,
+    browser_wait,
+)
+
+# The session-scoped facebook_page fixture owns a real Playwright context,
+# so the whole module stays pinned to a single xdist worker
+pytestmark = pytest.mark.xdist_group("facebook_session")
 
 
 # =============================================================================
@@ -23,6 +43,21 @@ from src.session import FacebookProfileManager, check_login_status, wait_for_log
 FACEBOOK_URL = "https://www.facebook.com"
 PROFILE_DIR = Path("./profiles/facebook")
 
+# Set FB_RECORD=1 to run the workflows against the real site (HITL login)
+FB_RECORD = os.getenv("FB_RECORD") == "1"
+
+_STATIC_FB_HTML = """<!DOCTYPE html>
+<html>
+<head><title>Facebook</title></head>
+<body>
+  <div role="feed"><div role="article">Stubbed news feed post</div></div>
+  <input aria-label="Search Facebook" placeholder="Search Facebook" />
+  <form action="/submit" method="post">
+    <input name="email" type="email" />
+  </form>
+</body>
+</html>"""
+
 
 # =============================================================================
 # Fixtures
@@ -30,7 +65,34 @@ PROFILE_DIR = Path("./profiles/facebook")
 
 @pytest.fixture(scope="session")
 def facebook_page(browser_type):
-    """Create a logged-in Facebook page with HITL fallback."""
+    """Create a Facebook page: route-stubbed by default, real with FB_RECORD=1."""
+    if not FB_RECORD:
+        # Answer every request locally; no Facebook network I/O or login.
+        # Headless on CI / non-interactive shells — headed Playwright is
+        # 2-3x slower and blocks on GPU init for no benefit without a human.
+        headless = os.getenv("CI", "").lower() in ("1", "true") or not sys.stdin.isatty()
+        browser = browser_type.launch(headless=headless)
+        context = browser.new_context(service_workers="block")
+        context.route(
+            "**/*",
+            lambda route: route.fulfill(
+                status=200, body=_STATIC_FB_HTML, content_type="text/html"
+            ),
+        )
+        page = context.new_page()
+
+        yield page
+
+        try:
+            context.close()
+        except Exception:
+            pass
+        try:
+            browser.close()
+        except Exception:
+            pass
+        return
+
     manager = FacebookProfileManager(
         profile_dir=PROFILE_DIR,
         headless=False,
@@ -73,31 +135,40 @@ def facebook_page(browser_type):
         pass
 
 
-# =============================================================================
-# Workflow Tests
-# =============================================================================
-
-def test_news_feed_screenshot(facebook_page: Page):
-    """Test: Go to news feed and take screenshot."""
-    # Go to news feed (homepage)
-    facebook_page.goto(FACEBOOK_URL, wait_until="domcontentloaded", timeout=60000)
+@pytest.fixture
+def fresh_page(facebook_page, request):
+    """facebook_page parked on the URL a workflow test asked for.
 
-    # Take screenshot
-    screenshot_path = "screenshots/news-feed.png"
-    facebook_page.screenshot(path=screenshot_path)
-    print(f"✅ News feed screenshot: {screenshot_path}")
+    Parametrized indirectly with the target URL; skips the 60s-timeout
+    goto when the previous test already left the page there.
+    """
+    target = request.param
+    if facebook_page.url != target:
+        facebook_page.goto(target, wait_until="domcontentloaded", timeout=60000)
+    return facebook_page
 
 
-def test_profile_screenshot(facebook_page: Page):
-    """Test: Go to profile and take screenshot."""
-    # Go to profile
-    profile_url = f"{FACEBOOK_URL}/me"
-    facebook_page.goto(profile_url, wait_until="domcontentloaded", timeout=60000)
+# =============================================================================
+# Workflow Tests
+# =============================================================================
 
-    # Take screenshot
-    screenshot_path = "screenshots/profile.png"
+@pytest.mark.parametrize(
+    "url, filename",
+    [
+        (FACEBOOK_URL, "news-feed.png"),
+        (f"{FACEBOOK_URL}/me", "profile.png"),
+    ],
+    ids=["news-feed", "profile"],
+)
+def test_page_screenshot(facebook_page: Page, url: str, filename: str):
+    """Test: Navigate to a page and take a screenshot."""
+    # domcontentloaded (not commit): the screenshots are the artifact, so
+    # the DOM needs to be there before capture
+    facebook_page.goto(url, wait_until="domcontentloaded", timeout=60000)
+
+    screenshot_path = f"screenshots/{filename}"
     facebook_page.screenshot(path=screenshot_path)
-    print(f"✅ Profile screenshot: {screenshot_path}")
+    print(f"✅ Screenshot: {screenshot_path}")
 
 
 # =============================================================================
@@ -105,23 +176,18 @@ def test_profile_screenshot(facebook_page: Page):
 # =============================================================================
 
 
-def test_interaction_tools_workflow(facebook_page: Page):
+@pytest.mark.parametrize("fresh_page", [f"{FACEBOOK_URL}/search"], indirect=True)
+def test_interaction_tools_workflow(fresh_page: Page):
     """Test: Use interaction tools (type, hover, press_key)."""
-    from src.tools.interaction import browser_type, browser_hover, browser_press_key
-    from src.tools.utilities import browser_wait
-
-    # Navigate to search page
-    facebook_page.goto(f"{FACEBOOK_URL}/search", wait_until="domcontentloaded", timeout=60000)
-
     # Wait for search input
-    result = browser_wait(selector='input[placeholder*="Search" i], input[aria-label*="Search" i]', page=facebook_page)
+    result = browser_wait(selector='input[placeholder*="Search" i], input[aria-label*="Search" i]', page=fresh_page)
     print(f"⏳ Wait result: {result}")
 
     # Type in search box (if found)
     try:
-        search_input = facebook_page.query_selector('input[placeholder*="Search" i], input[aria-label*="Search" i]')
+        search_input = fresh_page.query_selector('input[placeholder*="Search" i], input[aria-label*="Search" i]')
         if search_input:
-            result = browser_type(selector='input[placeholder*="Search" i]', text="Test", page=facebook_page)
+            result = browser_type(selector='input[placeholder*="Search" i]', text="Test", page=fresh_page)
             print(f"⌨️ Type result: {result}")
     except Exception as e:
         print(f"⚠️ Skip type test: {e}")
@@ -129,16 +195,12 @@ def test_interaction_tools_workflow(facebook_page: Page):
     print("✅ Interaction tools workflow completed")
 
 
-def test_form_tools_workflow(facebook_page: Page):
+@pytest.mark.parametrize("fresh_page", [f"{FACEBOOK_URL}/settings"], indirect=True)
+def test_form_tools_workflow(fresh_page: Page):
     """Test: Use form tools (fill_form, get_form_data)."""
-    from src.tools.forms import browser_fill_form, browser_get_form_data
-
-    # Navigate to a page with forms (settings page usually has forms)
-    facebook_page.goto(f"{FACEBOOK_URL}/settings", wait_until="domcontentloaded", timeout=60000)
-
     # Try to get form data from any form on page
     try:
-        result = browser_get_form_data(page=facebook_page)
+        result = browser_get_form_data(page=fresh_page)
         print(f"📋 Form data result: {result[:200]}...")
     except Exception as e:
         print(f"⚠️ Form data extraction: {e}")
@@ -146,36 +208,33 @@ def test_form_tools_workflow(facebook_page: Page):
     print("✅ Form tools workflow completed")
 
 
-def test_utility_tools_workflow(facebook_page: Page):
+@pytest.mark.parametrize("fresh_page", [FACEBOOK_URL], indirect=True)
+def test_utility_tools_workflow(fresh_page: Page):
     """Test: Use utility tools (wait, evaluate, get_snapshot, get_network)."""
-    from src.tools.utilities import (
-        browser_wait,
-        browser_evaluate,
-        browser_get_snapshot,
-        browser_get_network_requests,
-    )
-
-    # Navigate to news feed
-    facebook_page.goto(FACEBOOK_URL, wait_until="domcontentloaded", timeout=60000)
-
-    # Wait for page to stabilize
-    import time
-    time.sleep(2)
+    # Wait for the page to stabilize; returns as soon as the network goes
+    # quiet instead of burning a fixed 2s. Facebook's long-poll traffic can
+    # keep networkidle from firing, so fall back to the feed shell appearing.
+    try:
+        fresh_page.wait_for_load_state("networkidle", timeout=5000)
+    except Exception:
+        fresh_page.wait_for_selector(
+            '[role="feed"], [data-pagelet*="FeedUnit"]', timeout=5000, state="attached"
+        )
 
     # Get page info via evaluate
-    result = browser_evaluate(script="({url: window.location.href, title: document.title})", page=facebook_page)
+    result = browser_evaluate(script="({url: window.location.href, title: document.title})", page=fresh_page)
     print(f"📊 Evaluate result: {result}")
 
     # Get accessibility snapshot
     try:
-        result = browser_get_snapshot(root="body", page=facebook_page)
+        result = browser_get_snapshot(root="body", page=fresh_page)
         print(f"🖼️ Snapshot obtained (length: {len(result)} chars)")
     except Exception as e:
         print(f"⚠️ Snapshot: {e}")
 
     # Get network requests
     try:
-        result = browser_get_network_requests(limit=10, page=facebook_page)
+        result = browser_get_network_requests(limit=10, page=fresh_page)
         print(f"🌐 Network requests: {result[:200]}...")
     except Exception as e:
         print(f"⚠️ Network requests: {e}")
@@ -185,8 +244,6 @@ def test_utility_tools_workflow(facebook_page: Page):
 
 def test_browser_tools_workflow(facebook_page: Page):
     """Test: Use browser tools (tabs, resize, reload)."""
-    from src.tools.browser import browser_tabs, browser_resize, browser_reload
-
     # Test resize
     result = browser_resize(width=1280, height=720, page=facebook_page)
     print(f"📐 Resize result: {result}")